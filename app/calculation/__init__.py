@@ -11,10 +11,11 @@ Provides the core data model for calculations:
 - **CalculationHistory**: Manages a session-level list of past calculations.
 """
 
-from decimal import Decimal
-from typing import Callable, List, Optional
+import sys
+from collections import deque
+from typing import Callable, ClassVar, Iterator, List, Optional, Sequence
 
-from app.operation import add, subtract, multiply, divide
+from app.operation import Number, add, subtract, multiply, divide
 
 
 class Calculation:
@@ -26,13 +27,37 @@ class Calculation:
         operation: The callable that performs the arithmetic.
         operation_name: A human-readable name for the operation.
         result: The computed result.
+
+    A Calculation is not modified after construction, so its ``str`` and
+    ``repr`` are formatted on first use and then reused; entries that are
+    never displayed are never formatted.
     """
 
+    __slots__ = (
+        "operand_a",
+        "operand_b",
+        "operation",
+        "operation_name",
+        "result",
+        "_str",
+        "_repr",
+    )
+
+    # Display symbol for each operation name, used by __str__. Keyed by the
+    # public operation_name string rather than an enum index: names are
+    # interned with cached hashes, and __str__ looks the symbol up only once.
+    _SYMBOLS: ClassVar[dict[str, str]] = {
+        "add": "+",
+        "subtract": "-",
+        "multiply": "*",
+        "divide": "/",
+    }
+
     def __init__(
         self,
-        operand_a: Decimal,
-        operand_b: Decimal,
-        operation: Callable[[Decimal, Decimal], Decimal],
+        operand_a: Number,
+        operand_b: Number,
+        operation: Callable[[Number, Number], Number],
         operation_name: str,
     ) -> None:
         """Initialize and immediately compute the calculation.
@@ -40,7 +65,7 @@ class Calculation:
         Args:
             operand_a: The first operand.
             operand_b: The second operand.
-            operation: A callable that takes two Decimals and returns a Decimal.
+            operation: A callable that takes two numbers and returns a number.
             operation_name: Human-readable name (e.g., "add").
 
         Raises:
@@ -51,19 +76,24 @@ class Calculation:
         self.operation = operation
         self.operation_name = operation_name
         self.result = operation(operand_a, operand_b)
+        self._str: Optional[str] = None
+        self._repr: Optional[str] = None
 
     def __repr__(self) -> str:
         """Return a detailed string representation of the calculation."""
-        return (
-            f"Calculation({self.operand_a}, {self.operand_b}, "
-            f"{self.operation_name}) = {self.result}"
-        )
+        if self._repr is None:
+            self._repr = (
+                f"Calculation({self.operand_a}, {self.operand_b}, "
+                f"{self.operation_name}) = {self.result}"
+            )
+        return self._repr
 
     def __str__(self) -> str:
         """Return a user-friendly string of the calculation."""
-        symbols = {"add": "+", "subtract": "-", "multiply": "*", "divide": "/"}
-        symbol = symbols.get(self.operation_name, self.operation_name)
-        return f"{self.operand_a} {symbol} {self.operand_b} = {self.result}"
+        if self._str is None:
+            symbol = self._SYMBOLS.get(self.operation_name, self.operation_name)
+            self._str = f"{self.operand_a} {symbol} {self.operand_b} = {self.result}"
+        return self._str
 
 
 class CalculationFactory:
@@ -74,7 +104,7 @@ class CalculationFactory:
     """
 
     # Class-level mapping of operation names to functions (Strategy Pattern)
-    _operations: dict[str, Callable[[Decimal, Decimal], Decimal]] = {
+    _operations: dict[str, Callable[[Number, Number], Number]] = {
         "add": add,
         "subtract": subtract,
         "multiply": multiply,
@@ -83,7 +113,7 @@ class CalculationFactory:
 
     @classmethod
     def create(
-        cls, operand_a: Decimal, operand_b: Decimal, operation_name: str
+        cls, operand_a: Number, operand_b: Number, operation_name: str
     ) -> "Calculation":
         """Create a Calculation from an operation name string.
 
@@ -99,6 +129,8 @@ class CalculationFactory:
             ValueError: If the operation_name is not recognized.
             ZeroDivisionError: If dividing by zero.
         """
+        # Interned names share the dict keys' objects, so lookups match by identity
+        operation_name = sys.intern(operation_name)
         operation = cls._operations.get(operation_name)
         if operation is None:
             supported = ", ".join(cls._operations.keys())
@@ -108,6 +140,32 @@ class CalculationFactory:
             )
         return Calculation(operand_a, operand_b, operation, operation_name)
 
+    @classmethod
+    def create_unchecked(
+        cls, operand_a: Number, operand_b: Number, operation_name: str
+    ) -> "Calculation":
+        """Create a Calculation for an operation name known to be supported.
+
+        Skips the unknown-name check done by ``create``; callers must have
+        already validated ``operation_name`` (e.g. the Calculator's LBYL step).
+
+        Args:
+            operand_a: The first operand.
+            operand_b: The second operand.
+            operation_name: A supported operation name.
+
+        Returns:
+            A Calculation instance with the result already computed.
+
+        Raises:
+            KeyError: If the operation_name is not recognized.
+            ZeroDivisionError: If dividing by zero.
+        """
+        operation_name = sys.intern(operation_name)
+        return Calculation(
+            operand_a, operand_b, cls._operations[operation_name], operation_name
+        )
+
     @classmethod
     def get_supported_operations(cls) -> list[str]:
         """Return a list of supported operation names.
@@ -122,14 +180,22 @@ class CalculationHistory:
     """Maintains a history of Calculation objects for the current session.
 
     Provides methods to add, retrieve, and clear calculation history.
+    The history can be bounded, in which case the oldest calculations
+    are discarded once it is full.
     """
 
-    def __init__(self) -> None:
-        """Initialize an empty history."""
-        self._history: List[Calculation] = []
+    __slots__ = ("_history",)
+
+    def __init__(self, maxlen: Optional[int] = None) -> None:
+        """Initialize an empty history.
+
+        Args:
+            maxlen: Maximum number of calculations kept, or None for no limit.
+        """
+        self._history: deque[Calculation] = deque(maxlen=maxlen)
 
     def add(self, calculation: Calculation) -> None:
-        """Add a calculation to the history.
+        """Add a calculation to the history, dropping the oldest if full.
 
         Args:
             calculation: The Calculation instance to store.
@@ -137,13 +203,27 @@ class CalculationHistory:
         self._history.append(calculation)
 
     def get_all(self) -> List[Calculation]:
-        """Return all calculations in the history.
+        """Return a snapshot copy of all calculations in the history.
+
+        Use ``view()`` or iterate the history directly when a copy is not
+        needed.
 
         Returns:
-            A list of all Calculation objects, in order.
+            A new list of all Calculation objects, in order.
         """
         return list(self._history)
 
+    def view(self) -> Sequence[Calculation]:
+        """Return the stored calculations without copying them.
+
+        The returned sequence is the live storage and must be treated as
+        read-only; it reflects later additions and clears.
+
+        Returns:
+            A read-only sequence of all Calculation objects, in order.
+        """
+        return self._history
+
     def get_latest(self) -> Optional[Calculation]:
         """Return the most recent calculation, or None if history is empty.
 
@@ -156,10 +236,19 @@ class CalculationHistory:
         """Clear all calculations from the history."""
         self._history.clear()
 
+    @property
+    def maxlen(self) -> Optional[int]:
+        """The maximum number of calculations kept, or None if unbounded."""
+        return self._history.maxlen
+
     def __len__(self) -> int:
         """Return the number of calculations in the history."""
         return len(self._history)
 
+    def __iter__(self) -> Iterator[Calculation]:
+        """Iterate over the calculations in order, without copying."""
+        return iter(self._history)
+
     def __repr__(self) -> str:
         """Return a string representation of the history."""
         return f"CalculationHistory({len(self._history)} calculations)"
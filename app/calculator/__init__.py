@@ -13,10 +13,106 @@ Features:
     - Calculation history tracking
 """
 
+import os
 from decimal import Decimal, InvalidOperation
+from enum import Enum
+from typing import Callable, Sequence
 
 from app.calculation import CalculationFactory, CalculationHistory
 
+# Operation names, built once rather than on every validated input line.
+_VALID_OPS = frozenset(CalculationFactory._operations)
+_OPS_STR = ", ".join(CalculationFactory._operations)
+
+# Help text; the operation list is fixed at import, so it is built once.
+_HELP_TEXT = (
+    "=== Calculator Help ===\n"
+    "\n"
+    "Usage: <operation> <number1> <number2>\n"
+    "\n"
+    f"Operations: {_OPS_STR}\n"
+    "\n"
+    "Examples:\n"
+    "  add 5 3        => 5 + 3 = 8\n"
+    "  subtract 10 4  => 10 - 4 = 6\n"
+    "  multiply 6 7   => 6 * 7 = 42\n"
+    "  divide 20 4    => 20 / 4 = 5\n"
+    "\n"
+    "Special commands:\n"
+    "  help / ?   - Show this help message\n"
+    "  history    - Show calculation history\n"
+    "  clear      - Clear calculation history\n"
+    "  exit       - Exit the calculator"
+)
+
+
+class _Default(Enum):
+    """Marker for an omitted history_max; None already means "unbounded"."""
+
+    HISTORY_MAX = "history_max"
+
+
+# Largest integer magnitude up to which every integer is exact in a float64.
+_FLOAT_EXACT_MAX = 2**53
+
+
+def _fits_float(value: Decimal) -> bool:
+    """Return True if value is an integer that converts to float exactly."""
+    return value.as_tuple().exponent == 0 and abs(value) <= _FLOAT_EXACT_MAX
+
+
+def _history_max_from_env(default: int) -> int:
+    """Return ``CALC_HISTORY_MAX`` as a positive int, or default if unset.
+
+    Raises:
+        ValueError: If ``CALC_HISTORY_MAX`` is set but is not a positive
+            integer. Zero is rejected too, since it would keep no history.
+    """
+    raw = os.environ.get("CALC_HISTORY_MAX")
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        value = 0
+    if value < 1:
+        raise ValueError(f"CALC_HISTORY_MAX must be a positive integer, got {raw!r}")
+    return value
+
+
+def _validate_input_parts(parts: Sequence[str]) -> str | None:
+    """Validate that the input has the correct format (LBYL).
+
+    Checks:
+        1. Exactly three tokens are present.
+        2. The first token is a recognized operation name.
+
+    Both checks are O(1) (a length compare and a frozenset lookup), which
+    is cheaper than an ``lru_cache`` lookup would be, so the result is
+    deliberately not memoized.
+
+    Args:
+        parts: The tokenized user input (a list or a tuple).
+
+    Returns:
+        An error message string if invalid, or None if valid.
+    """
+    if len(parts) != 3:
+        return (
+            "Error: Invalid format. Please use: <operation> <number1> <number2>\n"
+            "Example: add 5 3\n"
+            "Type 'help' for available commands."
+        )
+
+    if parts[0] not in _VALID_OPS:
+        return (
+            f"Error: Unknown operation '{parts[0]}'.\n"
+            f"Available operations: {_OPS_STR}\n"
+            "Type 'help' for more information."
+        )
+
+    return None
+
 
 class Calculator:
     """Interactive calculator with a REPL interface.
@@ -27,14 +123,43 @@ class Calculator:
 
     Attributes:
         history: The CalculationHistory instance for this session.
+        fast: Whether integer operands use float arithmetic.
     """
 
+    __slots__ = ("history", "fast")
+
     # Special (non-arithmetic) commands
     SPECIAL_COMMANDS = ("help", "history", "clear", "exit")
 
-    def __init__(self) -> None:
-        """Initialize the calculator with an empty history."""
-        self.history = CalculationHistory()
+    # History bound used when neither history_max nor CALC_HISTORY_MAX is set
+    DEFAULT_HISTORY_MAX = 10_000
+
+    def __init__(
+        self,
+        fast: bool = False,
+        history_max: int | None | _Default = _Default.HISTORY_MAX,
+    ) -> None:
+        """Initialize the calculator with an empty history.
+
+        Args:
+            fast: Opt in to float arithmetic for integer operands that
+                convert to float without rounding. Only the operands are
+                exact: results are ordinary floats and are rounded once they
+                exceed 2**53 (a large sum or product, for example).
+            history_max: Maximum number of calculations kept in history,
+                or None for no limit. Defaults to the ``CALC_HISTORY_MAX``
+                environment variable, or ``DEFAULT_HISTORY_MAX`` if that is
+                unset. The oldest calculations are dropped once the limit
+                is reached.
+
+        Raises:
+            ValueError: If ``CALC_HISTORY_MAX`` is used and is not a positive
+                integer.
+        """
+        if history_max is _Default.HISTORY_MAX:
+            history_max = _history_max_from_env(self.DEFAULT_HISTORY_MAX)
+        self.history = CalculationHistory(maxlen=history_max)
+        self.fast = fast
 
     # ------------------------------------------------------------------
     # REPL
@@ -48,15 +173,13 @@ class Calculator:
         self._print_welcome()
         while True:
             try:
-                user_input = input("\n>>> ").strip()
+                user_input = input("\n>>> ")
             except (EOFError, KeyboardInterrupt):
                 print("\nGoodbye!")
                 break
 
-            if not user_input:
-                continue
-
-            if user_input.lower() == "exit":
+            # Blank lines need no check here: process_input ignores them.
+            if user_input.strip().lower() == "exit":
                 print("Goodbye!")
                 break
 
@@ -77,26 +200,32 @@ class Calculator:
             user_input: The raw string entered by the user.
 
         Returns:
-            A feedback message string describing the result or error.
+            A feedback message string describing the result or error,
+            or an empty string for blank input.
         """
-        command = user_input.strip().lower()
-
-        # --- Handle special commands ---
-        if command in ("help", "?"):
-            return self._handle_help()
-        if command == "history":
-            return self._handle_history()
-        if command == "clear":
-            return self._handle_clear()
-
-        # --- LBYL: validate input format before processing ---
-        parts = command.split()
-        validation_error = self._validate_input_parts(parts)
-        if validation_error:
+        # Tokenize once; only the command name is case-insensitive.
+        # Argument-less split() skips all surrounding and repeated whitespace
+        # in a single C-level pass, so no strip() or regex is needed.
+        parts = user_input.split()
+        if not parts:
+            return ""
+        parts[0] = command = parts[0].casefold()
+
+        # Fast path: the common "<op> <num> <num>" shape is valid as is, so
+        # special commands and validation are only consulted on a miss.
+        if len(parts) != 3 or command not in _VALID_OPS:
+            # --- Handle special commands (one hashed lookup) ---
+            if len(parts) == 1:
+                handler = _COMMANDS.get(command)
+                if handler is not None:
+                    return handler(self)
+
+            # --- LBYL: the format is wrong, so report why ---
+            validation_error = _validate_input_parts(parts)
             print(validation_error)
             return validation_error
 
-        operation_name, raw_a, raw_b = parts[0], parts[1], parts[2]
+        operation_name, raw_a, raw_b = parts
 
         # --- EAFP: attempt numeric conversion and calculation ---
         try:
@@ -110,14 +239,23 @@ class Calculator:
             print(msg)
             return msg
 
+        # Fast mode: integers that convert to float exactly use float
+        # arithmetic; the result itself is a (possibly rounded) float.
+        if self.fast and _fits_float(operand_a) and _fits_float(operand_b):
+            operand_a, operand_b = float(operand_a), float(operand_b)
+
         try:
-            calc = CalculationFactory.create(operand_a, operand_b, operation_name)
+            calc = CalculationFactory.create_unchecked(
+                operand_a, operand_b, operation_name
+            )
         except ZeroDivisionError:
             msg = "Error: Division by zero is not allowed."
             print(msg)
             return msg
-        except ValueError as exc:
-            msg = f"Error: {exc}"
+        except ArithmeticError:
+            # Decimal's InvalidOperation (0 / 0) and Overflow (exponent out
+            # of range); validation has already ruled out unknown operations.
+            msg = "Error: The result is undefined or out of range."
             print(msg)
             return msg
 
@@ -130,36 +268,9 @@ class Calculator:
     # LBYL validation helpers
     # ------------------------------------------------------------------
 
-    @staticmethod
-    def _validate_input_parts(parts: list[str]) -> str | None:
-        """Validate that the input has the correct format (LBYL).
-
-        Checks:
-            1. Exactly three tokens are present.
-            2. The first token is a recognized operation name.
-
-        Args:
-            parts: The tokenized user input.
-
-        Returns:
-            An error message string if invalid, or None if valid.
-        """
-        if len(parts) != 3:
-            return (
-                "Error: Invalid format. Please use: <operation> <number1> <number2>\n"
-                "Example: add 5 3\n"
-                "Type 'help' for available commands."
-            )
-
-        valid_operations = CalculationFactory.get_supported_operations()
-        if parts[0] not in valid_operations:
-            return (
-                f"Error: Unknown operation '{parts[0]}'.\n"
-                f"Available operations: {', '.join(valid_operations)}\n"
-                "Type 'help' for more information."
-            )
-
-        return None
+    # Exposed on the class for callers and tests; process_input calls the
+    # module-level function directly, skipping the staticmethod descriptor.
+    _validate_input_parts = staticmethod(_validate_input_parts)
 
     # ------------------------------------------------------------------
     # Special command handlers
@@ -171,28 +282,8 @@ class Calculator:
         Returns:
             The help text.
         """
-        operations = CalculationFactory.get_supported_operations()
-        help_text = (
-            "=== Calculator Help ===\n"
-            "\n"
-            "Usage: <operation> <number1> <number2>\n"
-            "\n"
-            f"Operations: {', '.join(operations)}\n"
-            "\n"
-            "Examples:\n"
-            "  add 5 3        => 5 + 3 = 8\n"
-            "  subtract 10 4  => 10 - 4 = 6\n"
-            "  multiply 6 7   => 6 * 7 = 42\n"
-            "  divide 20 4    => 20 / 4 = 5\n"
-            "\n"
-            "Special commands:\n"
-            "  help / ?   - Show this help message\n"
-            "  history    - Show calculation history\n"
-            "  clear      - Clear calculation history\n"
-            "  exit       - Exit the calculator"
-        )
-        print(help_text)
-        return help_text
+        print(_HELP_TEXT)
+        return _HELP_TEXT
 
     def _handle_history(self) -> str:
         """Display the calculation history.
@@ -200,17 +291,19 @@ class Calculator:
         Returns:
             The formatted history or a 'no history' message.
         """
-        calculations = self.history.get_all()
-        if not calculations:
+        if not self.history:
             msg = "No calculations in history."
             print(msg)
             return msg
 
-        lines = ["=== Calculation History ==="]
-        for i, calc in enumerate(calculations, start=1):
-            lines.append(f"  {i}. {calc}")
-        lines.append(f"\nTotal: {len(calculations)} calculation(s)")
-        history_text = "\n".join(lines)
+        # One join over all entries: a single allocation sized to the output
+        body = "".join(
+            [f"  {i}. {calc}\n" for i, calc in enumerate(self.history, start=1)]
+        )
+        history_text = (
+            "=== Calculation History ===\n"
+            f"{body}\nTotal: {len(self.history)} calculation(s)"
+        )
         print(history_text)
         return history_text
 
@@ -239,3 +332,12 @@ class Calculator:
             "Type 'help' for available commands.\n"
             "Type 'exit' to quit."
         )
+
+
+# Special commands, mapped once to their handlers for process_input
+_COMMANDS: dict[str, Callable[[Calculator], str]] = {
+    "help": Calculator._handle_help,
+    "?": Calculator._handle_help,
+    "history": Calculator._handle_history,
+    "clear": Calculator._handle_clear,
+}
@@ -5,15 +5,26 @@ Operation Module
 Provides basic arithmetic operations as static methods.
 Each operation takes two numeric values and returns the result.
 
+``float`` operands use Python's native float arithmetic.
+``add_many``, ``subtract_many``, ``multiply_many`` and ``divide_many`` apply
+an operation element-wise to whole NumPy arrays in one call, and
+``divide_batch`` divides into a preallocated array, in parallel when Numba
+is installed.
+
 This module demonstrates the EAFP (Easier to Ask Forgiveness than Permission)
 paradigm for error handling — division does not pre-check for zero; instead,
 callers handle the ZeroDivisionError exception.
 """
 
-from decimal import Decimal, InvalidOperation
+from decimal import Decimal
+from typing import Union
+
+from app.operation._fast import divide_kernel
 
+Number = Union[Decimal, float]
 
-def add(a: Decimal, b: Decimal) -> Decimal:
+
+def add(a: Number, b: Number) -> Number:
     """Return the sum of two numbers.
 
     Args:
@@ -26,11 +37,13 @@ def add(a: Decimal, b: Decimal) -> Decimal:
     Examples:
         >>> add(Decimal('2'), Decimal('3'))
         Decimal('5')
+        >>> add(1.5, 2.5)
+        4.0
     """
     return a + b
 
 
-def subtract(a: Decimal, b: Decimal) -> Decimal:
+def subtract(a: Number, b: Number) -> Number:
     """Return the difference of two numbers.
 
     Args:
@@ -47,7 +60,7 @@ def subtract(a: Decimal, b: Decimal) -> Decimal:
     return a - b
 
 
-def multiply(a: Decimal, b: Decimal) -> Decimal:
+def multiply(a: Number, b: Number) -> Number:
     """Return the product of two numbers.
 
     Args:
@@ -64,7 +77,7 @@ def multiply(a: Decimal, b: Decimal) -> Decimal:
     return a * b
 
 
-def divide(a: Decimal, b: Decimal) -> Decimal:
+def divide(a: Number, b: Number) -> Number:
     """Return the quotient of two numbers.
 
     Uses EAFP: does not pre-check for zero divisor.
@@ -86,3 +99,80 @@ def divide(a: Decimal, b: Decimal) -> Decimal:
         Decimal('5')
     """
     return a / b
+
+
+def _require_numpy():
+    """Return the numpy module, or raise ImportError if it is not installed.
+
+    NumPy is imported here, on the first batch call, so importing this
+    module (and starting the REPL) does not pay for it.
+    """
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("NumPy is required for the batch operations") from None
+    return numpy
+
+
+def add_many(a: "np.ndarray", b: "np.ndarray") -> "np.ndarray":
+    """Return the element-wise sums of two arrays (requires NumPy).
+
+    Examples:
+        >>> import numpy as np
+        >>> add_many(np.array([1.0, 2.0]), np.array([3.0, 4.0]))
+        array([4., 6.])
+    """
+    return _require_numpy().add(a, b)
+
+
+def subtract_many(a: "np.ndarray", b: "np.ndarray") -> "np.ndarray":
+    """Return the element-wise differences of two arrays (requires NumPy)."""
+    return _require_numpy().subtract(a, b)
+
+
+def multiply_many(a: "np.ndarray", b: "np.ndarray") -> "np.ndarray":
+    """Return the element-wise products of two arrays (requires NumPy)."""
+    return _require_numpy().multiply(a, b)
+
+
+def divide_many(a: "np.ndarray", b: "np.ndarray") -> "np.ndarray":
+    """Return the element-wise quotients of two arrays (requires NumPy).
+
+    Unlike ``divide``, a zero divisor follows NumPy semantics: the result
+    is ``inf`` or ``nan`` (with a RuntimeWarning) instead of an exception.
+    """
+    return _require_numpy().divide(a, b)
+
+
+def divide_batch(
+    a: "np.ndarray", b: "np.ndarray", out: "np.ndarray"
+) -> "np.ndarray":
+    """Write ``a / b`` element-wise into ``out`` and return it (requires NumPy).
+
+    With Numba installed the division runs in parallel, in a kernel that is
+    compiled on the first call rather than at import. Otherwise it is a
+    single ``np.divide`` call. Like ``divide_many``, a zero divisor gives
+    ``inf``/``nan`` instead of raising.
+
+    The Numba kernel does no bounds checking, so the shapes are checked
+    here for both backends.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+        TypeError: If out is not a NumPy array.
+        ValueError: If a, b and out are not 1-D arrays of the same shape.
+    """
+    np = _require_numpy()
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    if not isinstance(out, np.ndarray):
+        raise TypeError("divide_batch needs a NumPy array for out")
+    if a.ndim != 1 or not a.shape == b.shape == out.shape:
+        raise ValueError(
+            "divide_batch needs 1-D arrays of the same shape, got "
+            f"{a.shape}, {b.shape} and {out.shape}"
+        )
+    kernel = divide_kernel()
+    if kernel is None:
+        return np.divide(a, b, out=out)
+    return kernel(a, b, out)  # pragma: no cover - only when Numba is installed
@@ -0,0 +1,40 @@
+"""
+Fast Operation Kernels
+======================
+
+Numba-compiled kernels used by ``app.operation.divide_batch``. Importing
+this module does not import Numba: ``divide_kernel`` imports it and
+compiles the parallel kernel (or loads it from the on-disk cache) on its
+first call, so code that never divides a batch never pays for Numba.
+
+Scalar operations are deliberately not compiled here: a call into a Numba
+function costs more than the single float operation it would run.
+"""
+
+import functools
+from importlib.util import find_spec
+
+# Whether Numba is installed, checked without importing it.
+HAS_NUMBA = find_spec("numba") is not None
+
+
+@functools.cache
+def divide_kernel():
+    """Return the parallel Numba divide kernel, or None without Numba.
+
+    The kernel writes ``a[i] / b[i]`` into ``out[i]`` and returns out. It
+    does no bounds checking, so callers must pass 1-D float64 arrays of
+    one shape. Following NumPy, a zero divisor gives ``inf``/``nan``.
+    """
+    if not HAS_NUMBA:
+        return None
+
+    from numba import njit, prange  # pragma: no cover - only with Numba
+
+    @njit(parallel=True, cache=True, error_model="numpy")
+    def divide_batch(a, b, out):  # pragma: no cover - only with Numba
+        for i in prange(a.size):
+            out[i] = a[i] / b[i]
+        return out
+
+    return divide_batch  # pragma: no cover - only with Numba
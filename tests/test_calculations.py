@@ -6,6 +6,8 @@ Parameterized tests covering Calculation, CalculationFactory,
 and CalculationHistory classes with positive and negative cases.
 """
 
+import sys
+
 import pytest
 from decimal import Decimal
 
@@ -73,6 +75,14 @@ class TestCalculation:
         result_str = str(calc)
         assert "custom_op" in result_str
 
+    def test_calculation_formats_once(self) -> None:
+        """Test that str/repr are formatted lazily, cached, and slotted."""
+        calc = Calculation(Decimal("2"), Decimal("3"), add, "add")
+        assert calc._str is None and calc._repr is None
+        assert str(calc) is str(calc)
+        assert repr(calc) is repr(calc)
+        assert not hasattr(calc, "__dict__")
+
     def test_calculation_division_by_zero(self) -> None:
         """Test that creating a division-by-zero Calculation raises."""
         with pytest.raises(ZeroDivisionError):
@@ -105,11 +115,44 @@ class TestCalculationFactory:
         assert calc.result == expected
         assert calc.operation_name == op_name
 
+    def test_create_with_floats(self) -> None:
+        """Test that float operands produce a float result."""
+        calc = CalculationFactory.create(7.0, 2.0, "divide")
+        assert calc.result == 3.5
+        assert isinstance(calc.result, float)
+
+    @pytest.mark.parametrize(
+        "create",
+        [CalculationFactory.create, CalculationFactory.create_unchecked],
+        ids=["create", "create_unchecked"],
+    )
+    def test_create_interns_operation_name(self, create) -> None:
+        """Test that a runtime-built name is stored as the interned string."""
+        name = "".join(["mul", "tiply"])
+        calc = create(Decimal("2"), Decimal("3"), name)
+        assert calc.operation_name is sys.intern("multiply")
+
     def test_create_unknown_operation(self) -> None:
         """Test that an unknown operation raises ValueError."""
         with pytest.raises(ValueError, match="Unknown operation"):
             CalculationFactory.create(Decimal("1"), Decimal("2"), "modulo")
 
+    @pytest.mark.parametrize(
+        "op_name, expected",
+        [("add", Decimal("3")), ("divide", Decimal("0.5"))],
+        ids=["unchecked_add", "unchecked_divide"],
+    )
+    def test_create_unchecked(self, op_name: str, expected: Decimal) -> None:
+        """Test that create_unchecked builds the same Calculation as create."""
+        calc = CalculationFactory.create_unchecked(Decimal("1"), Decimal("2"), op_name)
+        assert calc.result == expected
+        assert calc.operation_name == op_name
+
+    def test_create_unchecked_unknown_operation(self) -> None:
+        """Test that create_unchecked raises KeyError for unknown names."""
+        with pytest.raises(KeyError):
+            CalculationFactory.create_unchecked(Decimal("1"), Decimal("2"), "modulo")
+
     def test_create_division_by_zero(self) -> None:
         """Test that factory propagates ZeroDivisionError."""
         with pytest.raises(ZeroDivisionError):
@@ -137,6 +180,7 @@ class TestCalculationHistory:
         """Test that a new history is empty."""
         history = CalculationHistory()
         assert len(history) == 0
+        assert history.maxlen is None
         assert history.get_all() == []
         assert history.get_latest() is None
 
@@ -148,6 +192,7 @@ class TestCalculationHistory:
         assert len(history) == 1
         assert history.get_latest() == calc
         assert history.get_all() == [calc]
+        assert list(history) == [calc]
 
     def test_multiple_calculations(self) -> None:
         """Test that multiple calculations are stored in order."""
@@ -160,6 +205,16 @@ class TestCalculationHistory:
         assert history.get_latest() == calc2
         assert history.get_all() == [calc1, calc2]
 
+    def test_get_all_is_snapshot_view_is_live(self) -> None:
+        """Test that get_all copies while view exposes the live storage."""
+        history = CalculationHistory()
+        snapshot = history.get_all()
+        view = history.view()
+        calc = Calculation(Decimal("1"), Decimal("2"), add, "add")
+        history.add(calc)
+        assert snapshot == []
+        assert list(view) == [calc]
+
     def test_clear_history(self) -> None:
         """Test clearing the history."""
         history = CalculationHistory()
@@ -168,6 +223,23 @@ class TestCalculationHistory:
         assert len(history) == 0
         assert history.get_latest() is None
 
+    def test_bounded_history_drops_oldest(self) -> None:
+        """Test that a bounded history keeps only the newest calculations."""
+        history = CalculationHistory(maxlen=2)
+        calcs = [
+            Calculation(Decimal(n), Decimal("1"), add, "add") for n in ("1", "2", "3")
+        ]
+        for calc in calcs:
+            history.add(calc)
+        assert history.maxlen == 2
+        assert len(history) == 2
+        assert list(history) == calcs[1:]
+        assert history.get_latest() == calcs[2]
+
+    def test_no_instance_dict(self) -> None:
+        """Test that CalculationHistory uses __slots__ instead of a __dict__."""
+        assert not hasattr(CalculationHistory(), "__dict__")
+
     def test_repr(self) -> None:
         """Test the repr of CalculationHistory."""
         history = CalculationHistory()
@@ -9,8 +9,8 @@ Uses capsys to capture printed output.
 
 import pytest
 from decimal import Decimal
-from unittest.mock import patch
 
+from app.calculation import CalculationFactory
 from app.calculator import Calculator
 
 
@@ -43,6 +43,10 @@ class TestArithmeticOperations:
             ("add -5 3", "-5 + 3 = -2"),
             ("multiply 0 100", "0 * 100 = 0"),
             ("add 1.5 2.5", "1.5 + 2.5 = 4.0"),
+            ("divide 1 3", "1 / 3 = 0.3333333333333333333333333333"),
+            ("multiply 2e3 .5", "2E+3 * 0.5 = 1.0E+3"),
+            ("add 1e30 1", "1E+30 + 1 = 1.000000000000000000000000000E+30"),
+            ("add 1e5000 1", "1E+5000 + 1 = 1.000000000000000000000000000E+5000"),
         ],
         ids=[
             "add_basic",
@@ -52,6 +56,10 @@ class TestArithmeticOperations:
             "negative_operand",
             "zero_operand",
             "decimal_operand",
+            "repeating_decimal",
+            "scientific_notation",
+            "rounded_to_precision",
+            "huge_exponent",
         ],
     )
     def test_valid_operations(
@@ -61,6 +69,63 @@ class TestArithmeticOperations:
         result = calculator.process_input(user_input)
         assert expected_substring in result
 
+    @pytest.mark.parametrize(
+        "kwargs, env_value, expected_len",
+        [
+            ({}, None, 3),
+            ({"history_max": 2}, None, 2),
+            ({}, "1", 1),
+            ({"history_max": 2}, "1", 2),
+            ({"history_max": None}, "1", 3),
+            ({}, "-1", ValueError),
+            ({}, "0", ValueError),
+            ({}, "ten", ValueError),
+        ],
+        ids=[
+            "default",
+            "argument",
+            "env_var",
+            "argument_over_env_var",
+            "unbounded",
+            "env_var_negative",
+            "env_var_zero",
+            "env_var_not_integer",
+        ],
+    )
+    def test_history_max(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        kwargs: dict,
+        env_value: str | None,
+        expected_len: int | type[Exception],
+    ) -> None:
+        """Test that history is bounded by history_max or CALC_HISTORY_MAX.
+
+        An expected exception class means the environment value is rejected.
+        """
+        if env_value is None:
+            monkeypatch.delenv("CALC_HISTORY_MAX", raising=False)
+        else:
+            monkeypatch.setenv("CALC_HISTORY_MAX", env_value)
+        if isinstance(expected_len, type):
+            with pytest.raises(expected_len, match="positive integer"):
+                Calculator(**kwargs)
+            return
+        calculator = Calculator(**kwargs)
+        for _ in range(3):
+            calculator.process_input("add 1 2")
+        assert len(calculator.history) == expected_len
+
+    def test_history_bounded_by_default(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a long session's history is bounded out of the box."""
+        monkeypatch.delenv("CALC_HISTORY_MAX", raising=False)
+        calculator = Calculator()
+        assert calculator.history.maxlen == Calculator.DEFAULT_HISTORY_MAX
+
+    def test_uses_slots(self, calculator: Calculator) -> None:
+        """Test that Calculator uses __slots__ instead of a __dict__."""
+        assert not hasattr(calculator, "__dict__")
+
     def test_operation_adds_to_history(self, calculator: Calculator) -> None:
         """Test that successful operations are recorded in history."""
         calculator.process_input("add 2 3")
@@ -68,6 +133,40 @@ class TestArithmeticOperations:
         assert calculator.history.get_latest() is not None
 
 
+class TestFastMode:
+    """Test the opt-in float fast path."""
+
+    @pytest.mark.parametrize(
+        "user_input, expected_substring",
+        [
+            ("add 5 3", "5.0 + 3.0 = 8.0"),
+            ("divide 7 2", "7.0 / 2.0 = 3.5"),
+            ("add 0.1 0.2", "0.1 + 0.2 = 0.3"),
+            ("multiply 9007199254740993 1", "9007199254740993 * 1 = 9007199254740993"),
+            ("add 9007199254740992 1", "= 9007199254740992.0"),
+        ],
+        ids=[
+            "integers",
+            "integer_division",
+            "decimals_stay_exact",
+            "too_large",
+            "result_rounds",
+        ],
+    )
+    def test_fast_mode(self, user_input: str, expected_substring: str) -> None:
+        """Test that only float-exact integers take the fast path.
+
+        The operands are exact, but the float result may still be rounded.
+        """
+        result = Calculator(fast=True).process_input(user_input)
+        assert expected_substring in result
+
+    def test_fast_division_by_zero(self) -> None:
+        """Test that division by zero is still reported in fast mode."""
+        result = Calculator(fast=True).process_input("divide 10 0")
+        assert "Division by zero" in result
+
+
 # ===========================================================================
 # Input validation (LBYL)
 # ===========================================================================
@@ -84,6 +183,7 @@ class TestInputValidation:
             "add 5 3 2",
             "5 3",
             "",
+            "help me",
         ],
         ids=[
             "one_token",
@@ -91,6 +191,7 @@ class TestInputValidation:
             "four_tokens",
             "missing_operation",
             "empty_after_strip",
+            "command_with_arguments",
         ],
     )
     def test_invalid_format(self, calculator: Calculator, user_input: str) -> None:
@@ -104,8 +205,9 @@ class TestInputValidation:
             "modulo 5 3",
             "power 2 8",
             "sqrt 9 0",
+            "history 1 2",
         ],
-        ids=["modulo", "power", "sqrt"],
+        ids=["modulo", "power", "sqrt", "command_name"],
     )
     def test_unknown_operation(self, calculator: Calculator, user_input: str) -> None:
         """Test that unknown operations produce a clear error."""
@@ -132,8 +234,16 @@ class TestErrorHandling:
             "add abc 3",
             "add 5 xyz",
             "add abc xyz",
+            "add . 3",
+            "add 1e 3",
+        ],
+        ids=[
+            "invalid_first",
+            "invalid_second",
+            "both_invalid",
+            "lone_point",
+            "missing_exponent",
         ],
-        ids=["invalid_first", "invalid_second", "both_invalid"],
     )
     def test_invalid_numbers(self, calculator: Calculator, user_input: str) -> None:
         """Test that non-numeric inputs are handled gracefully."""
@@ -145,20 +255,16 @@ class TestErrorHandling:
         calculator.process_input("divide 10 0")
         assert len(calculator.history) == 0
 
-    def test_value_error_from_factory(self, calculator: Calculator) -> None:
-        """Test that a ValueError raised by CalculationFactory is handled (EAFP).
-
-        This covers the except-ValueError branch in process_input that is
-        normally unreachable because LBYL validation catches unknown
-        operations first.  We patch the factory to force the path.
-        """
-        with patch(
-            "app.calculator.CalculationFactory.create",
-            side_effect=ValueError("Injected error"),
-        ):
-            result = calculator.process_input("add 1 2")
-        assert "Error" in result
-        assert "Injected error" in result
+    @pytest.mark.parametrize(
+        "user_input",
+        ["divide 0 0", "multiply 9e999999999 9e999999999"],
+        ids=["undefined", "overflow"],
+    )
+    def test_arithmetic_error(self, calculator: Calculator, user_input: str) -> None:
+        """Test that undefined or overflowing results are reported (EAFP)."""
+        result = calculator.process_input(user_input)
+        assert result == "Error: The result is undefined or out of range."
+        assert len(calculator.history) == 0
 
 
 # ===========================================================================
@@ -169,12 +275,30 @@ class TestErrorHandling:
 class TestSpecialCommands:
     """Test special (non-arithmetic) commands."""
 
+    @pytest.fixture(scope="class")
+    @classmethod
+    def calculator(cls) -> Calculator:
+        """Provide one Calculator shared by every test in this class."""
+        return Calculator()
+
+    @pytest.fixture(autouse=True)
+    def _reset_history(self, calculator: Calculator) -> None:
+        """Start each test with an empty history on the shared Calculator."""
+        calculator.history.clear()
+
     def test_help_command(self, calculator: Calculator) -> None:
         """Test the 'help' command."""
         result = calculator.process_input("help")
         assert "Calculator Help" in result
         assert "add" in result
 
+    def test_help_lists_every_operation(self, calculator: Calculator) -> None:
+        """Test that the prebuilt help text lists all supported operations."""
+        result = calculator.process_input("help")
+        for operation in CalculationFactory.get_supported_operations():
+            assert operation in result
+        assert calculator.process_input("?") is result
+
     def test_help_question_mark(self, calculator: Calculator) -> None:
         """Test the '?' shortcut for help."""
         result = calculator.process_input("?")
@@ -211,12 +335,25 @@ class TestSpecialCommands:
         result = calculator.process_input("ADD 5 3")
         assert "5 + 3 = 8" in result
 
+    def test_blank_input(self, calculator: Calculator) -> None:
+        """Test that whitespace-only input is ignored."""
+        assert calculator.process_input("   ") == ""
+
+    def test_operands_keep_case(self, calculator: Calculator) -> None:
+        """Test that only the command name is lowercased, not the numbers."""
+        result = calculator.process_input("ADD Abc 3")
+        assert "'Abc'" in result
+
     def test_whitespace_handling(self, calculator: Calculator) -> None:
         """Test that extra whitespace is handled."""
         result = calculator.process_input("  add   5   3  ")
-        # After split(), extra whitespace may cause token count issues
-        # This tests that strip() is applied
-        assert "Error" in result or "+" in result
+        # split() tokenizes regardless of leading, trailing or repeated spaces
+        assert result == "Result: 5 + 3 = 8"
+
+    def test_tab_separated_input(self, calculator: Calculator) -> None:
+        """Test that any whitespace, not just spaces, separates tokens."""
+        result = calculator.process_input("\tmultiply\t6 \t7\n")
+        assert result == "Result: 6 * 7 = 42"
 
 
 # ===========================================================================
@@ -231,6 +368,27 @@ class TestValidateInputParts:
         """Test that valid input returns None (no error)."""
         assert Calculator._validate_input_parts(["add", "5", "3"]) is None
 
+    @pytest.mark.parametrize(
+        "operation", CalculationFactory.get_supported_operations()
+    )
+    def test_every_supported_operation_is_valid(self, operation: str) -> None:
+        """Test that the prebuilt operation set matches the factory."""
+        assert Calculator._validate_input_parts([operation, "5", "3"]) is None
+
+    def test_operation_name_is_case_sensitive(self) -> None:
+        """Test that validation expects the already-lowercased command name.
+
+        process_input case-folds the name first; the factory lookup is
+        case-sensitive, so the validator must be too.
+        """
+        result = Calculator._validate_input_parts(["ADD", "5", "3"])
+        assert result is not None
+        assert "Unknown operation" in result
+
+    def test_tuple_input(self) -> None:
+        """Test that any sequence of tokens is accepted, not just a list."""
+        assert Calculator._validate_input_parts(("add", "5", "3")) is None
+
     def test_too_few_parts(self) -> None:
         """Test that too few tokens returns an error."""
         result = Calculator._validate_input_parts(["add", "5"])
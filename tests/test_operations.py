@@ -7,133 +7,209 @@ add, subtract, multiply, divide — including edge cases
 (zero, negative numbers, decimals, large numbers, division by zero).
 """
 
+import sys
+
 import pytest
 from decimal import Decimal
 
-from app.operation import add, subtract, multiply, divide
+from app.operation import (
+    add,
+    subtract,
+    multiply,
+    divide,
+    add_many,
+    subtract_many,
+    multiply_many,
+    divide_many,
+    divide_batch,
+)
+
+
+# Decimal literals used by the case tables, parsed once at import.
+_D = {
+    text: Decimal(text)
+    for text in (
+        "-10", "-8", "-6", "-5", "-4", "-3", "-2", "-1", "0", "0.1", "0.2",
+        "0.3", "0.5", "1", "1.5", "2", "2.5", "3", "3.0", "3.5", "4", "4.0",
+        "5", "7", "10", "10.0", "10.5", "12", "100", "200", "300", "999",
+        "1000", "1000000", "999999999", "1000000000",
+    )
+}
 
 
 # ---------------------------------------------------------------------------
-# Parameterized tests for add
+# Case tables: id -> (a, b, expected), shared by the scalar and batch tests
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.parametrize(
-    "a, b, expected",
-    [
-        (Decimal("2"), Decimal("3"), Decimal("5")),
-        (Decimal("0"), Decimal("0"), Decimal("0")),
-        (Decimal("-1"), Decimal("1"), Decimal("0")),
-        (Decimal("-5"), Decimal("-3"), Decimal("-8")),
-        (Decimal("1.5"), Decimal("2.5"), Decimal("4.0")),
-        (Decimal("100"), Decimal("200"), Decimal("300")),
-        (Decimal("999999999"), Decimal("1"), Decimal("1000000000")),
-        (Decimal("0.1"), Decimal("0.2"), Decimal("0.3")),
-    ],
-    ids=[
-        "positive+positive",
-        "zero+zero",
-        "negative+positive",
-        "negative+negative",
-        "decimal+decimal",
-        "large+large",
-        "large_boundary",
-        "small_decimals",
-    ],
-)
-def test_add(a: Decimal, b: Decimal, expected: Decimal) -> None:
-    """Test addition with various input scenarios."""
-    assert add(a, b) == expected
+ADD_CASES = {
+    "positive+positive": (_D["2"], _D["3"], _D["5"]),
+    "zero+zero": (_D["0"], _D["0"], _D["0"]),
+    "negative+positive": (_D["-1"], _D["1"], _D["0"]),
+    "negative+negative": (_D["-5"], _D["-3"], _D["-8"]),
+    "decimal+decimal": (_D["1.5"], _D["2.5"], _D["4.0"]),
+    "large+large": (_D["100"], _D["200"], _D["300"]),
+    "large_boundary": (_D["999999999"], _D["1"], _D["1000000000"]),
+    "small_decimals": (_D["0.1"], _D["0.2"], _D["0.3"]),
+}
+
+SUBTRACT_CASES = {
+    "positive-positive": (_D["5"], _D["3"], _D["2"]),
+    "zero-zero": (_D["0"], _D["0"], _D["0"]),
+    "negative-negative": (_D["-1"], _D["-1"], _D["0"]),
+    "result_negative": (_D["3"], _D["5"], _D["-2"]),
+    "decimal_subtraction": (_D["10.5"], _D["0.5"], _D["10.0"]),
+    "large_subtraction": (_D["1000"], _D["1"], _D["999"]),
+}
+
+MULTIPLY_CASES = {
+    "positive*positive": (_D["4"], _D["3"], _D["12"]),
+    "zero_factor": (_D["0"], _D["100"], _D["0"]),
+    "negative*positive": (_D["-2"], _D["3"], _D["-6"]),
+    "negative*negative": (_D["-3"], _D["-4"], _D["12"]),
+    "decimal*integer": (_D["1.5"], _D["2"], _D["3.0"]),
+    "large_multiplication": (_D["1000"], _D["1000"], _D["1000000"]),
+}
+
+DIVIDE_CASES = {
+    "even_division": (_D["10"], _D["2"], _D["5"]),
+    "decimal_result": (_D["7"], _D["2"], _D["3.5"]),
+    "zero_dividend": (_D["0"], _D["5"], _D["0"]),
+    "negative_dividend": (_D["-10"], _D["2"], _D["-5"]),
+    "both_negative": (_D["-10"], _D["-2"], _D["5"]),
+    "repeating_decimal": (_D["1"], _D["3"], _D["1"] / _D["3"]),
+}
 
 
 # ---------------------------------------------------------------------------
-# Parameterized tests for subtract
+# Table-driven test for add, subtract, multiply and divide
 # ---------------------------------------------------------------------------
 
 
 @pytest.mark.parametrize(
-    "a, b, expected",
+    "operation, a, b, expected",
     [
-        (Decimal("5"), Decimal("3"), Decimal("2")),
-        (Decimal("0"), Decimal("0"), Decimal("0")),
-        (Decimal("-1"), Decimal("-1"), Decimal("0")),
-        (Decimal("3"), Decimal("5"), Decimal("-2")),
-        (Decimal("10.5"), Decimal("0.5"), Decimal("10.0")),
-        (Decimal("1000"), Decimal("1"), Decimal("999")),
-    ],
-    ids=[
-        "positive-positive",
-        "zero-zero",
-        "negative-negative",
-        "result_negative",
-        "decimal_subtraction",
-        "large_subtraction",
+        pytest.param(operation, *case, id=f"{operation.__name__}-{case_id}")
+        for operation, cases in (
+            (add, ADD_CASES),
+            (subtract, SUBTRACT_CASES),
+            (multiply, MULTIPLY_CASES),
+            (divide, DIVIDE_CASES),
+        )
+        for case_id, case in cases.items()
     ],
 )
-def test_subtract(a: Decimal, b: Decimal, expected: Decimal) -> None:
-    """Test subtraction with various input scenarios."""
-    assert subtract(a, b) == expected
+def test_operation(operation, a: Decimal, b: Decimal, expected: Decimal) -> None:
+    """Test each arithmetic operation with various input scenarios."""
+    assert operation(a, b) == expected
+
+
+def test_divide_by_zero() -> None:
+    """Test that dividing by zero raises ZeroDivisionError (EAFP)."""
+    with pytest.raises(ZeroDivisionError):
+        divide(Decimal("10"), Decimal("0"))
 
 
 # ---------------------------------------------------------------------------
-# Parameterized tests for multiply
+# Parameterized tests for float operands
 # ---------------------------------------------------------------------------
 
 
 @pytest.mark.parametrize(
-    "a, b, expected",
+    "operation, a, b, expected",
     [
-        (Decimal("4"), Decimal("3"), Decimal("12")),
-        (Decimal("0"), Decimal("100"), Decimal("0")),
-        (Decimal("-2"), Decimal("3"), Decimal("-6")),
-        (Decimal("-3"), Decimal("-4"), Decimal("12")),
-        (Decimal("1.5"), Decimal("2"), Decimal("3.0")),
-        (Decimal("1000"), Decimal("1000"), Decimal("1000000")),
-    ],
-    ids=[
-        "positive*positive",
-        "zero_factor",
-        "negative*positive",
-        "negative*negative",
-        "decimal*integer",
-        "large_multiplication",
+        (add, 1.5, 2.25, 3.75),
+        (subtract, 1.5, 2.25, -0.75),
+        (multiply, 1.5, 2.25, 3.375),
+        (divide, 1.5, 2.5, 0.6),
+        (add, 2, 3, 5),
     ],
+    ids=["add", "subtract", "multiply", "divide", "ints_stay_int"],
 )
-def test_multiply(a: Decimal, b: Decimal, expected: Decimal) -> None:
-    """Test multiplication with various input scenarios."""
-    assert multiply(a, b) == expected
+def test_float_operands(operation, a, b, expected) -> None:
+    """Test that float operands give floats and ints stay exact."""
+    result = operation(a, b)
+    assert result == expected
+    assert type(result) is type(expected)
+
+
+def test_float_divide_by_zero() -> None:
+    """Test that float division by zero raises ZeroDivisionError."""
+    with pytest.raises(ZeroDivisionError):
+        divide(10.0, 0.0)
 
 
 # ---------------------------------------------------------------------------
-# Parameterized tests for divide
+# Vectorized tests for the NumPy batch operations
 # ---------------------------------------------------------------------------
 
 
 @pytest.mark.parametrize(
-    "a, b, expected",
+    "batch_operation, cases",
     [
-        (Decimal("10"), Decimal("2"), Decimal("5")),
-        (Decimal("7"), Decimal("2"), Decimal("3.5")),
-        (Decimal("0"), Decimal("5"), Decimal("0")),
-        (Decimal("-10"), Decimal("2"), Decimal("-5")),
-        (Decimal("-10"), Decimal("-2"), Decimal("5")),
-        (Decimal("1"), Decimal("3"), Decimal("1") / Decimal("3")),
-    ],
-    ids=[
-        "even_division",
-        "decimal_result",
-        "zero_dividend",
-        "negative_dividend",
-        "both_negative",
-        "repeating_decimal",
+        (add_many, ADD_CASES),
+        (subtract_many, SUBTRACT_CASES),
+        (multiply_many, MULTIPLY_CASES),
+        (divide_many, DIVIDE_CASES),
     ],
+    ids=["add_many", "subtract_many", "multiply_many", "divide_many"],
 )
-def test_divide(a: Decimal, b: Decimal, expected: Decimal) -> None:
-    """Test division with various input scenarios."""
-    assert divide(a, b) == expected
+def test_batch_operations(batch_operation, cases) -> None:
+    """Test each batch operation against its whole case table in one call."""
+    np = pytest.importorskip("numpy")
+    a, b, expected = np.array(list(cases.values()), dtype=np.float64).T
+    assert np.allclose(batch_operation(a, b), expected)
 
 
-def test_divide_by_zero() -> None:
-    """Test that dividing by zero raises ZeroDivisionError (EAFP)."""
-    with pytest.raises(ZeroDivisionError):
-        divide(Decimal("10"), Decimal("0"))
+def test_batch_divide_by_zero() -> None:
+    """Test that batch division by zero gives inf instead of raising."""
+    np = pytest.importorskip("numpy")
+    with pytest.warns(RuntimeWarning):
+        result = divide_many(np.array([1.0]), np.array([0.0]))
+    assert np.isinf(result[0])
+
+
+def test_divide_batch() -> None:
+    """Test the parallel batch division kernel, including a zero divisor."""
+    np = pytest.importorskip("numpy")
+    a = np.array([1.0, 2.0, -6.0])
+    b = np.array([2.0, 0.0, 3.0])
+    out = np.empty(3)
+    with np.errstate(divide="ignore"):
+        result = divide_batch(a, b, out)
+    assert result is out
+    assert out[0] == 0.5 and np.isinf(out[1]) and out[2] == -2.0
+
+
+@pytest.mark.parametrize(
+    "a_len, b_len, out_len, ndim",
+    [(8, 8, 2, 1), (4, 1, 4, 1), (4, 4, 4, 2)],
+    ids=["short_out", "short_divisor", "two_dimensional"],
+)
+def test_divide_batch_rejects_bad_shapes(
+    a_len: int, b_len: int, out_len: int, ndim: int
+) -> None:
+    """Test that divide_batch checks shapes before running either backend."""
+    np = pytest.importorskip("numpy")
+    shape = (2,) * (ndim - 1)
+    a = np.ones(shape + (a_len,))
+    b = np.ones(shape + (b_len,))
+    out = np.empty(shape + (out_len,))
+    with pytest.raises(ValueError, match="1-D arrays of the same shape"):
+        divide_batch(a, b, out)
+
+
+def test_divide_batch_needs_array_out() -> None:
+    """Test that out must be a NumPy array, while inputs may be lists."""
+    np = pytest.importorskip("numpy")
+    with pytest.raises(TypeError, match="NumPy array"):
+        divide_batch([1.0], [2.0], [0.0])
+    out = np.empty(1)
+    assert divide_batch([1.0], [2.0], out)[0] == 0.5
+
+
+def test_batch_requires_numpy(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that batch operations raise ImportError without NumPy."""
+    monkeypatch.setitem(sys.modules, "numpy", None)
+    with pytest.raises(ImportError, match="NumPy"):
+        add_many([1.0], [2.0])